@@ -0,0 +1,43 @@
+# cython: language_level=3
+"""
+C implementation of the calculator's numeric core.
+
+Optional: when the compiled extension is importable, calculator uses it in
+place of the Numba/Python versions of _angle_factor and _compute_core.
+Build it with `python setup.py build_ext --inplace`.
+"""
+from libc.math cimport NAN, fabs, fmod, isfinite
+
+
+cpdef double angle_factor(double angle) noexcept nogil:
+    """
+    Triangle-wave angle factor, see calculator.calculate_angle_factor.
+    """
+    # NaN/inf have no position on the circle, as in calculator._angle_factor
+    if not isfinite(angle):
+        return NAN
+    
+    cdef double t = fmod(angle * (1.0 / 90.0), 2.0)
+    # fmod keeps the sign of the angle; fold negatives into [0, 2) like %
+    if t < 0.0:
+        t += 2.0
+    return 0.1 + 0.9 * fabs(t - 1.0)
+
+
+cpdef tuple compute_core(double distance, double wind, double angle,
+                         bint divisor_is_headwind):
+    """
+    Numeric core of calculate_steps.
+
+    Returns:
+    tuple: (angle_factor, step_3, adjusted_distance)
+    """
+    cdef double factor = angle_factor(angle)
+    cdef double step_3
+    
+    # Headwind: Divisor is 180, add Step 3. Tailwind: Divisor is 225, subtract
+    if divisor_is_headwind:
+        step_3 = distance * wind * factor * (1.0 / 180.0)
+        return factor, step_3, distance + step_3
+    step_3 = distance * wind * factor * (1.0 / 225.0)
+    return factor, step_3, distance - step_3
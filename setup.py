@@ -0,0 +1,21 @@
+"""
+Builds the optional calculator_c extension in place:
+
+    python setup.py build_ext --inplace
+
+The app runs without it, falling back to the Numba/Python numeric core.
+"""
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+setup(
+    name="wgt-golf-calculator",
+    ext_modules=cythonize([
+        Extension(
+            "calculator_c",
+            ["calculator_c.pyx"],
+            # -ffast-math would also let the compiler drop the isfinite guard
+            extra_compile_args=["-O3", "-ffast-math", "-fno-finite-math-only"],
+        )
+    ]),
+)
@@ -0,0 +1,144 @@
+import importlib.machinery
+import importlib.util
+import math
+import os
+import sys
+
+import numpy as np
+import pytest
+
+
+def _load_calculator():
+    # The calculator module has no .py extension, so load it by path
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "calculator")
+    loader = importlib.machinery.SourceFileLoader("calculator", path)
+    spec = importlib.util.spec_from_loader("calculator", loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["calculator"] = module
+    loader.exec_module(module)
+    return module
+
+
+calculator = _load_calculator()
+
+
+def triangle_wave(angle):
+    """Closed-form angle factor the lookup tables are checked against."""
+    return 0.1 + 0.9 * abs(((angle / 90.0) % 2.0) - 1.0)
+
+
+@pytest.mark.parametrize("angle", [0, 1, 45, 89, 90, 180, 270, 359, 360, 720])
+def test_angle_factor_whole_degrees(angle):
+    assert calculator.calculate_angle_factor(angle) == pytest.approx(triangle_wave(angle))
+
+
+@pytest.mark.parametrize("angle", [0.5, 33.3, 89.9, 90.1, 179.25, 300.7, 359.999])
+def test_angle_factor_fractional(angle):
+    assert calculator.calculate_angle_factor(angle) == pytest.approx(triangle_wave(angle))
+
+
+@pytest.mark.parametrize("angle", [-1e-20, -0.5, -45, -90, -200.3, -719])
+def test_angle_factor_negative(angle):
+    assert calculator.calculate_angle_factor(angle) == pytest.approx(triangle_wave(angle))
+
+
+@pytest.mark.parametrize("angle", [math.nan, math.inf, -math.inf])
+def test_angle_factor_non_finite(angle):
+    assert math.isnan(calculator.calculate_angle_factor(angle))
+
+
+@pytest.mark.parametrize("angle", [45, 33.3])
+def test_steps_are_plain_floats(angle):
+    results = calculator.calculate_steps(100, 10, angle, "tailwind")
+    assert type(results.angle_factor) is float
+    assert type(results.adjusted_distance) is float
+
+
+@pytest.mark.filterwarnings("error")
+def test_angle_factor_array_matches_scalar():
+    angles = np.concatenate([
+        np.arange(-720.0, 720.0, 0.37),
+        np.arange(0.0, 360.0),
+        [-1e-20, math.nan, math.inf, -math.inf],
+    ])
+    expected = [calculator.calculate_angle_factor(a) for a in angles]
+    np.testing.assert_allclose(
+        calculator.calculate_angle_factor_array(angles), expected, atol=1e-12)
+
+
+def test_steps_invalid_direction():
+    with pytest.raises(ValueError, match="Invalid wind direction"):
+        calculator.calculate_steps(103, 15, 0, "crosswind")
+
+
+def test_steps_direction_is_case_insensitive():
+    assert calculator.calculate_steps(103, 15, 0, "HeadWind").is_head
+
+
+def test_steps_with_nan_angle():
+    results = calculator.calculate_steps(100, 10, math.nan, "headwind")
+    assert math.isnan(results.angle_factor)
+    assert math.isnan(results.adjusted_distance)
+
+
+def test_format_steps_headwind():
+    # The worked example from the app's "How it works" section
+    results = calculator.format_steps(calculator.calculate_steps(103, 15, 0, "headwind"))
+    assert results["step_1"] == {"formula": "103.0 * 15.0", "result": 1545.0}
+    assert results["angle_factor"] == 1.0
+    assert results["step_2"] == {"divisor": 180.0, "formula": "180.0 / 1.0000", "result": 180.0}
+    assert results["step_3"]["formula"] == "1545.0000 / 180.0000"
+    assert results["step_3"]["result"] == pytest.approx(8.583333333333334)
+    assert results["step_4"]["formula"] == "103.0 + 8.5833"
+    assert results["adjusted_distance"] == pytest.approx(111.58333333333333)
+
+
+def test_format_steps_tailwind():
+    results = calculator.format_steps(calculator.calculate_steps(103, 15, 0, "tailwind"))
+    assert results["step_2"]["formula"] == "225.0 / 1.0000"
+    assert results["step_3"]["formula"] == "1545.0000 / 225.0000"
+    assert results["step_4"]["formula"] == "103.0 - 6.8667"
+    assert results["adjusted_distance"] == pytest.approx(96.13333333333334)
+
+
+@pytest.mark.parametrize("is_headwind", [True, False])
+def test_steps_batch_matches_scalar(is_headwind):
+    rng = np.random.default_rng(0)
+    distances = rng.uniform(50.0, 300.0, 500)
+    winds = rng.uniform(0.0, 30.0, 500)
+    angles = np.concatenate([rng.uniform(-360.0, 720.0, 250), rng.integers(0, 360, 250)])
+    direction = "headwind" if is_headwind else "tailwind"
+    expected = [
+        calculator.calculate_steps(d, w, a, direction).adjusted_distance
+        for d, w, a in zip(distances, winds, angles)
+    ]
+    np.testing.assert_allclose(
+        calculator.calculate_steps_batch(distances, winds, angles, is_headwind), expected)
+
+
+def test_steps_batch_broadcasts_scalars_over_angles():
+    angles = np.arange(0.0, 360.0, 15.0)
+    is_headwind = angles < 180.0
+    expected = [
+        calculator.calculate_steps(103, 15, a, "headwind" if h else "tailwind").adjusted_distance
+        for a, h in zip(angles, is_headwind)
+    ]
+    adjusted = calculator.calculate_steps_batch(103, 15, angles, is_headwind)
+    assert adjusted.shape == angles.shape
+    np.testing.assert_allclose(adjusted, expected)
+
+
+def test_c_extension_matches_closed_form():
+    calculator_c = pytest.importorskip("calculator_c")
+    rng = np.random.default_rng(1)
+    distances = rng.uniform(50.0, 300.0, 2000)
+    winds = rng.uniform(0.0, 30.0, 2000)
+    angles = np.concatenate([rng.uniform(-720.0, 1080.0, 1500),
+                             rng.integers(-360, 720, 500).astype(np.float64)])
+    is_headwind = rng.random(2000) < 0.5
+    expected = calculator.calculate_steps_batch(distances, winds, angles, is_headwind)
+    adjusted = [calculator_c.compute_core(d, w, a, h)[2]
+                for d, w, a, h in zip(distances, winds, angles, is_headwind)]
+    np.testing.assert_allclose(adjusted, expected, rtol=1e-12)
+    for angle in (math.nan, math.inf, -math.inf):
+        assert math.isnan(calculator_c.angle_factor(angle))